@@ -9,6 +9,8 @@ __author__ = "AI Team"
 # Import main components
 from .queue.queue_service import QueueService
 from .queue.rabbitmq_service import RabbitMQService
+from .queue.async_rabbitmq_service import AsyncRabbitMQService
+from .queue.event_loop_rabbitmq_service import EventLoopRabbitMQService
 from .utils.gpu_memory_utils import GPUMemoryUtils
 from .utils.image_utils import ImageUtils
 from .patterns.base_model_processor import BaseModelProcessor
@@ -16,6 +18,8 @@ from .patterns.base_model_processor import BaseModelProcessor
 __all__ = [
     "QueueService",
     "RabbitMQService", 
+    "AsyncRabbitMQService",
+    "EventLoopRabbitMQService",
     "GPUMemoryUtils",
     "ImageUtils",
     "BaseModelProcessor"
@@ -1,7 +1,11 @@
 """Base processor class with common patterns"""
 
+import atexit
+import functools
 import logging
-from abc import ABC, abstractmethod
+import threading
+import weakref
+from abc import ABC, ABCMeta, abstractmethod
 from typing import Optional, Dict, Any
 
 try:
@@ -13,7 +17,42 @@ except ImportError:
 from ..utils.gpu_memory_utils import GPUMemoryUtils
 
 
-class BaseModelProcessor(ABC):
+@functools.lru_cache(maxsize=1)
+def _cached_device() -> str:
+    """Best available device, probed once per process"""
+    if TORCH_AVAILABLE:
+        # An initialized CUDA context implies a usable GPU; skip the driver probe
+        if torch.cuda.is_initialized() or torch.cuda.is_available():
+            return "cuda"
+    return "cpu"
+
+
+def _offload_at_exit(method_ref: weakref.WeakMethod) -> None:
+    """atexit hook offloading a processor's model if the processor is still alive"""
+    offload = method_ref()
+    if offload is not None:
+        try:
+            offload()
+        except Exception:
+            pass  # Ignore errors during interpreter shutdown
+
+
+class SingletonMeta(ABCMeta):
+    """Metaclass returning one cached instance per class without re-running __init__"""
+    
+    def __call__(cls, *args, **kwargs):
+        instance = cls._instances.get(cls)
+        if instance is None:
+            # Double-checked locking so concurrent first calls cannot load the model twice
+            with cls._instances_lock:
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instances[cls] = instance
+        return instance
+
+
+class BaseModelProcessor(ABC, metaclass=SingletonMeta):
     """
     Abstract base class for AI processors implementing common patterns:
     - Singleton pattern
@@ -23,38 +62,49 @@ class BaseModelProcessor(ABC):
     """
     
     _instances = {}
+    _instances_lock = threading.RLock()  # Re-entrant: a processor may construct another in __init__
     
-    def __new__(cls, *args, **kwargs):
-        """Implement singleton pattern per class"""
-        if cls not in cls._instances:
-            cls._instances[cls] = super(BaseModelProcessor, cls).__new__(cls)
-        return cls._instances[cls]
-    
-    def __init__(self, lazy_load_model: bool = True, logger: Optional[logging.Logger] = None):
+    def __init__(self, 
+                 lazy_load_model: bool = True, 
+                 persistent_memory_pool: bool = False,
+                 logger: Optional[logging.Logger] = None):
         """
         Initialize base processor
         
         Args:
             lazy_load_model: Whether to use lazy loading for models
+            persistent_memory_pool: Allocate the model from a dedicated CUDA memory pool
+                that stays reserved across offloads, making reloads cheap at the
+                cost of not returning that memory to other allocations
             logger: Optional logger instance
         """
-        # Prevent re-initialization in singleton
-        if hasattr(self, '_initialized'):
-            return
-            
         self.lazy_load_model = lazy_load_model
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         self.device = self._get_device()
         self.model = None
-        self._initialized = True
+        self.persistent_memory_pool = persistent_memory_pool
+        self._offload_stream = None  # Side stream for asynchronous offloads and reloads
+        self._offload_event = None  # Completion event of the last asynchronous offload
+        self._staged_model = None  # Offloaded model whose tensors live in pinned host memory
+        self._model_source = None  # (model_path, kwargs) the current or staged model was loaded from
+        
+        # Weak reference so the hook does not keep the processor alive
+        atexit.register(_offload_at_exit, weakref.WeakMethod(self._offload_model))
+        self._mem_pool = None
+        if persistent_memory_pool and self.device == "cuda":
+            self._mem_pool = GPUMemoryUtils.create_memory_pool()
+            if self._mem_pool is None:
+                self.logger.warning("CUDA memory pools not supported by this PyTorch build, using default allocator")
         
         self.logger.info(f"{self.__class__.__name__} initialized on device: {self.device}")
     
     def _get_device(self) -> str:
         """Get the best available device"""
-        if TORCH_AVAILABLE and torch.cuda.is_available():
-            return "cuda"
-        return "cpu"
+        return _cached_device()
+    
+    def _memory_pool_context(self):
+        """Context manager routing CUDA allocations to the processor's memory pool, if any"""
+        return GPUMemoryUtils.use_memory_pool(self._mem_pool)
     
     @abstractmethod
     def _load_model(self, model_path: str, **kwargs):
@@ -79,10 +129,26 @@ class BaseModelProcessor(ABC):
             **kwargs: Additional model loading parameters
         """
         if self.model is None:
-            self.logger.info(f"Loading model from: {model_path}")
+            source = (model_path, kwargs)
+            staged, self._staged_model = self._staged_model, None
             GPUMemoryUtils.log_gpu_memory_usage(self.logger, "Before loading")
             
-            self.model = self._load_model(model_path, **kwargs)
+            if staged is not None and self._model_source == source:
+                # Restore the pinned host copy; queued on the offload stream, so it
+                # is ordered after the offload copies without a host synchronization.
+                # The freed device blocks stay cached and are reused for the copies
+                self.logger.info(f"Restoring offloaded model from pinned memory: {model_path}")
+                self._offload_event = None
+                with self._memory_pool_context():
+                    GPUMemoryUtils.reload_model_async(staged, self._offload_stream)
+                self.model = staged
+            else:
+                del staged  # Loaded from another source; release its pinned memory first
+                self._release_offloaded_memory(wait=False)
+                self.logger.info(f"Loading model from: {model_path}")
+                with self._memory_pool_context():
+                    self.model = self._load_model(model_path, **kwargs)
+                self._model_source = source
             
             GPUMemoryUtils.log_gpu_memory_usage(self.logger, "After loading")
     
@@ -92,14 +158,47 @@ class BaseModelProcessor(ABC):
             self.logger.info("Offloading model to free memory")
             GPUMemoryUtils.log_gpu_memory_usage(self.logger, "Before offload")
             
-            # Move model to CPU and delete
-            GPUMemoryUtils.offload_model(self.model, self.logger)
-            del self.model
-            self.model = None
-            
-            GPUMemoryUtils.clear_gpu_memory(self.logger)
+            # Memory is logged here, not per helper call
+            if self.device == "cuda" and hasattr(self.model, 'parameters'):
+                # Copy to pinned memory on a side stream and keep that copy for the next load.
+                # The device blocks return to the caching allocator once the copies finish;
+                # empty_cache would block on them, so they are released to the driver lazily
+                if self._offload_stream is None:
+                    self._offload_stream = torch.cuda.Stream()
+                self._offload_event = GPUMemoryUtils.offload_model_async(self.model, self._offload_stream)
+                self._staged_model = self.model
+                self.model = None
+            else:
+                GPUMemoryUtils.offload_model(self.model)
+                del self.model
+                self.model = None
+                GPUMemoryUtils.clear_gpu_memory(full_gc=True)
             GPUMemoryUtils.log_gpu_memory_usage(self.logger, "After offload")
     
+    def _release_offloaded_memory(self, wait: bool = True):
+        """
+        Return device memory of the last asynchronous offload to the driver
+        
+        Args:
+            wait: Block until the offload copies finish; otherwise only release
+                the memory if they already have
+        """
+        if self._offload_event is None:
+            return
+        if not wait and not self._offload_event.query():
+            return
+        self._offload_event.synchronize()
+        self._offload_event = None
+        GPUMemoryUtils.clear_gpu_memory()
+    
+    def release_offloaded_model(self):
+        """Drop the pinned host copy kept by the last offload, so the next load calls _load_model"""
+        if self._staged_model is not None:
+            self.logger.info("Releasing offloaded model from pinned memory")
+            self._release_offloaded_memory()
+            self._staged_model = None
+            self._model_source = None
+    
     def is_model_loaded(self) -> bool:
         """Check if model is currently loaded"""
         return self.model is not None
@@ -121,17 +220,24 @@ class BaseModelProcessor(ABC):
         """Force clear all GPU memory"""
         self.logger.info("Force clearing all GPU memory")
         
-        GPUMemoryUtils.log_gpu_memory_usage(self.logger, "Before force clear")
+        # Query memory once per phase and reuse the result for logging and checks
+        gpu_before = GPUMemoryUtils.get_gpu_memory_usage()
+        GPUMemoryUtils.log_gpu_memory_usage(self.logger, "Before force clear", stats=gpu_before)
         
-        # Offload model first
+        # Offload model first, without keeping a pinned host copy
         self._offload_model()
+        self.release_offloaded_model()
         
-        # Additional aggressive cleanup
-        GPUMemoryUtils.clear_gpu_memory(self.logger)
+        # Drop the persistent pool so its reserved blocks can be released
+        if self._mem_pool is not None:
+            self._mem_pool = GPUMemoryUtils.create_memory_pool()
         
-        GPUMemoryUtils.log_gpu_memory_usage(self.logger, "After force clear")
+        # Additional aggressive cleanup
+        GPUMemoryUtils.clear_gpu_memory(synchronize=True, full_gc=True)
         
         gpu_status = GPUMemoryUtils.get_gpu_memory_usage()
+        GPUMemoryUtils.log_gpu_memory_usage(self.logger, "After force clear", stats=gpu_status)
+        
         if gpu_status and gpu_status['allocated'] > 0.1:  # Still more than 100MB
             self.logger.warning("GPU memory still not fully cleared!")
             self.logger.info("You may need to restart the Python process to fully clear GPU memory")
@@ -158,11 +264,3 @@ class BaseModelProcessor(ABC):
         """Context manager exit - cleanup resources"""
         if self.lazy_load_model:
             self._offload_model()
-    
-    def __del__(self):
-        """Destructor to ensure cleanup"""
-        try:
-            if hasattr(self, 'model') and self.model is not None:
-                self._offload_model()
-        except Exception:
-            pass  # Ignore errors during cleanup
@@ -2,5 +2,7 @@
 
 from .queue_service import QueueService
 from .rabbitmq_service import RabbitMQService
+from .async_rabbitmq_service import AsyncRabbitMQService
+from .event_loop_rabbitmq_service import EventLoopRabbitMQService
 
-__all__ = ["QueueService", "RabbitMQService"]
+__all__ = ["QueueService", "RabbitMQService", "AsyncRabbitMQService", "EventLoopRabbitMQService"]
@@ -0,0 +1,234 @@
+"""Asyncio RabbitMQ service based on aio-pika"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable, Optional
+
+try:
+    import aio_pika
+    AIO_PIKA_AVAILABLE = True
+except ImportError:
+    AIO_PIKA_AVAILABLE = False
+
+from .rabbitmq_service import _CONTENT_TYPE, _build_ssl_context, _dumps, _loads
+
+
+def _json_message(payload: dict) -> "aio_pika.Message":
+    """Build a persistent JSON message"""
+    return aio_pika.Message(
+        body=_dumps(payload),
+        content_type=_CONTENT_TYPE,
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+    )
+
+
+class AsyncRabbitMQService:
+    """
+    Asyncio variant of RabbitMQService
+
+    Publishes, acknowledgements and handler execution overlap with network I/O
+    on a single event loop. The connection is robust (auto-reconnecting) and
+    consumers are restored automatically after a reconnect.
+    """
+
+    def __init__(self,
+                 host: str = "localhost",
+                 port: int = 5672,
+                 virtual_host: str = "/",
+                 username: str = "guest",
+                 password: str = "guest",
+                 use_tls: bool = False,
+                 ca_cert_path: Optional[str] = None,
+                 cert_path: Optional[str] = None,
+                 key_path: Optional[str] = None,
+                 verify_hostname: bool = False,
+                 heartbeat: int = 30,
+                 prefetch_count: int = 100,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize asyncio RabbitMQ service
+
+        Args:
+            host: RabbitMQ server host
+            port: RabbitMQ server port (default: 5672 for non-TLS, 5671 for TLS)
+            virtual_host: Virtual host name
+            username: Username for authentication
+            password: Password for authentication
+            use_tls: Enable TLS/SSL connection
+            ca_cert_path: Path to CA certificate file (for TLS)
+            cert_path: Path to client certificate file (for TLS with client auth)
+            key_path: Path to client private key file (for TLS with client auth)
+            verify_hostname: Whether to verify hostname in TLS connection
+            heartbeat: Heartbeat interval in seconds (default: 30)
+            prefetch_count: Max unacknowledged messages per consumer (default: 100)
+            logger: Optional logger instance
+        """
+        if not AIO_PIKA_AVAILABLE:
+            raise ImportError("aio-pika not available")
+
+        self.host = host
+        # Default to TLS port if TLS is enabled and port is default
+        if use_tls and port == 5672:
+            self.port = 5671
+        else:
+            self.port = port
+        self.virtual_host = virtual_host
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.heartbeat = heartbeat
+        self.prefetch_count = prefetch_count
+
+        # Configure SSL context if TLS is enabled (shared with RabbitMQService)
+        self.ssl_context = None
+        if use_tls:
+            self.ssl_context = _build_ssl_context(ca_cert_path, cert_path, key_path, verify_hostname)
+
+        self.logger = logger or logging.getLogger(__name__)
+        self._connection = None
+        self._publish_channel = None
+        self._declared_queues = set()
+        self._consumer_channels = {}  # Consumer channel per queue
+        self._connect_lock = None  # Created lazily inside the running event loop
+
+    async def connect(self) -> None:
+        """Open the robust connection if it is not already open"""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._connection is None or self._connection.is_closed:
+                self._connection = await aio_pika.connect_robust(
+                    host=self.host,
+                    port=self.port,
+                    login=self.username,
+                    password=self.password,
+                    virtualhost=self.virtual_host,
+                    ssl=self.use_tls,
+                    ssl_context=self.ssl_context,
+                    heartbeat=self.heartbeat,
+                )
+                self.logger.info(f"Async RabbitMQ connection opened to {self.host}:{self.port}")
+
+    async def _get_publish_channel(self):
+        """Get or create the publisher channel (with publisher confirms)"""
+        await self.connect()
+        if self._publish_channel is None or self._publish_channel.is_closed:
+            self._publish_channel = await self._connection.channel(publisher_confirms=True)
+        return self._publish_channel
+
+    async def _ensure_queue(self, channel, queue_name: str) -> None:
+        """Declare a durable queue once per service instance"""
+        if queue_name not in self._declared_queues:
+            await channel.declare_queue(queue_name, durable=True)
+            self._declared_queues.add(queue_name)
+
+    async def publish(self, queue_name: str, payload: dict) -> None:
+        """
+        Publish a message to the specified queue and wait for the broker confirm
+
+        Args:
+            queue_name: Name of the queue to publish to
+            payload: Message payload as dictionary
+        """
+        try:
+            channel = await self._get_publish_channel()
+            await self._ensure_queue(channel, queue_name)
+            await channel.default_exchange.publish(
+                _json_message(payload),
+                routing_key=queue_name,
+            )
+            self.logger.info(f"Message published to queue '{queue_name}'")
+        except Exception as e:
+            self.logger.error(f"Error publishing message to queue '{queue_name}': {str(e)}")
+            raise
+
+    async def publish_batch(self, queue_name: str, payloads: Iterable[dict]) -> None:
+        """
+        Publish several messages concurrently, awaiting all broker confirms together
+
+        Args:
+            queue_name: Name of the queue to publish to
+            payloads: Message payloads as dictionaries
+        """
+        try:
+            channel = await self._get_publish_channel()
+            await self._ensure_queue(channel, queue_name)
+            exchange = channel.default_exchange
+            results = await asyncio.gather(*(
+                exchange.publish(
+                    _json_message(payload),
+                    routing_key=queue_name,
+                )
+                for payload in payloads
+            ))
+            self.logger.info(f"{len(results)} messages published to queue '{queue_name}'")
+        except Exception as e:
+            self.logger.error(f"Error publishing batch to queue '{queue_name}': {str(e)}")
+            raise
+
+    async def register_consumer(self,
+                                queue_name: str,
+                                handler: Callable[[dict], Awaitable[None]],
+                                prefetch_count: Optional[int] = None) -> None:
+        """
+        Register an async consumer handler for the specified queue
+
+        Messages are acknowledged when the handler returns and rejected
+        (without requeue) when parsing or the handler raises.
+
+        Args:
+            queue_name: Name of the queue to consume from
+            handler: Coroutine function to handle incoming messages
+            prefetch_count: Optional override of the service-wide prefetch_count
+        """
+        if queue_name in self._consumer_channels:
+            self.logger.warning(f"Consumer for queue '{queue_name}' already registered. Skipping.")
+            return
+
+        await self.connect()
+        channel = await self._connection.channel()
+        await channel.set_qos(prefetch_count=self.prefetch_count if prefetch_count is None else prefetch_count)
+        queue = await channel.declare_queue(queue_name, durable=True)
+
+        async def on_message(message) -> None:
+            try:
+                async with message.process(requeue=False):
+                    await handler(_loads(message.body))
+            except Exception as e:
+                self.logger.error(f"Error handling message from queue '{queue_name}': {str(e)}")
+
+        await queue.consume(on_message)
+        self._consumer_channels[queue_name] = channel
+        self.logger.info(f"Async consumer registered for queue '{queue_name}'")
+
+    async def stop_consuming(self) -> None:
+        """
+        Stop all consumers by closing their channels
+
+        Messages whose handler has not finished yet are redelivered by the broker.
+        """
+        for queue_name, channel in list(self._consumer_channels.items()):
+            try:
+                await channel.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing consumer channel for queue '{queue_name}': {str(e)}")
+        self._consumer_channels.clear()
+        self.logger.info("All async consumers stopped")
+
+    async def close_connection(self) -> None:
+        """Close all channels and the connection"""
+        if self._connection and not self._connection.is_closed:
+            await self._connection.close()
+            self.logger.info("Async RabbitMQ connection closed")
+        self._connection = None
+        self._publish_channel = None
+        self._consumer_channels.clear()
+
+    async def __aenter__(self):
+        """Async context manager entry - opens the connection"""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - closes the connection"""
+        await self.close_connection()
@@ -0,0 +1,182 @@
+"""Synchronous QueueService running aio-pika on a background event loop"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Callable, Iterable, Optional
+
+from .queue_service import QueueService
+from .async_rabbitmq_service import AIO_PIKA_AVAILABLE, AsyncRabbitMQService
+
+
+class EventLoopRabbitMQService(QueueService):
+    """
+    Blocking QueueService facade over AsyncRabbitMQService
+
+    All queues share one aio-pika connection driven by an asyncio event loop
+    on a single background thread. Blocking handlers run on a thread pool via
+    run_in_executor, so the event loop keeps reading, publishing and
+    acknowledging while they work. Publishes are pipelined with publisher
+    confirms; publish_batch awaits all confirms of a batch together.
+    """
+
+    def __init__(self,
+                 host: str = "localhost",
+                 port: int = 5672,
+                 virtual_host: str = "/",
+                 username: str = "guest",
+                 password: str = "guest",
+                 use_tls: bool = False,
+                 ca_cert_path: Optional[str] = None,
+                 cert_path: Optional[str] = None,
+                 key_path: Optional[str] = None,
+                 verify_hostname: bool = False,
+                 heartbeat: int = 30,
+                 prefetch_count: int = 100,
+                 handler_workers: int = 4,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize the service and start its event loop thread
+
+        Args:
+            host: RabbitMQ server host
+            port: RabbitMQ server port (default: 5672 for non-TLS, 5671 for TLS)
+            virtual_host: Virtual host name
+            username: Username for authentication
+            password: Password for authentication
+            use_tls: Enable TLS/SSL connection
+            ca_cert_path: Path to CA certificate file (for TLS)
+            cert_path: Path to client certificate file (for TLS with client auth)
+            key_path: Path to client private key file (for TLS with client auth)
+            verify_hostname: Whether to verify hostname in TLS connection
+            heartbeat: Heartbeat interval in seconds (default: 30)
+            prefetch_count: Max unacknowledged messages per consumer (default: 100)
+            handler_workers: Threads running blocking handlers, shared by all queues (default: 4)
+            logger: Optional logger instance
+        """
+        if not AIO_PIKA_AVAILABLE:
+            raise ImportError("aio-pika not available")
+
+        self.logger = logger or logging.getLogger(__name__)
+        self._service = AsyncRabbitMQService(
+            host=host,
+            port=port,
+            virtual_host=virtual_host,
+            username=username,
+            password=password,
+            use_tls=use_tls,
+            ca_cert_path=ca_cert_path,
+            cert_path=cert_path,
+            key_path=key_path,
+            verify_hostname=verify_hostname,
+            heartbeat=heartbeat,
+            prefetch_count=prefetch_count,
+            logger=self.logger,
+        )
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=handler_workers,
+            thread_name_prefix="Handler"
+        )
+        self._consumers = set()  # Queues with a registered handler
+        self._stop_event = threading.Event()
+        self._closed = False
+
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._run_loop, name="RabbitMQ-EventLoop", daemon=True)
+        self._loop_thread.start()
+
+    def _run_loop(self) -> None:
+        """Run the event loop until close_connection stops it (loop thread)"""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _run(self, coro):
+        """Run a coroutine on the event loop and block until it returns"""
+        if self._closed:
+            coro.close()
+            raise RuntimeError("Queue service is closed")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def publish(self, queue_name: str, payload: dict) -> None:
+        """
+        Publish a message to the specified queue and wait for the broker confirm
+
+        Args:
+            queue_name: Name of the queue to publish to
+            payload: Message payload as dictionary
+        """
+        self._run(self._service.publish(queue_name, payload))
+
+    def publish_batch(self, queue_name: str, payloads: Iterable[dict]) -> None:
+        """
+        Publish several messages with pipelined publisher confirms
+
+        Args:
+            queue_name: Name of the queue to publish to
+            payloads: Message payloads as dictionaries
+        """
+        self._run(self._service.publish_batch(queue_name, list(payloads)))
+
+    def register_consumer(self,
+                          queue_name: str,
+                          handler: Callable[[dict], None],
+                          prefetch_count: Optional[int] = None) -> None:
+        """
+        Register a consumer handler for the specified queue
+
+        Consumption starts immediately. Messages are acknowledged when the
+        handler returns and rejected (without requeue) when it raises.
+
+        Args:
+            queue_name: Name of the queue to consume from
+            handler: Blocking callback function to handle incoming messages
+            prefetch_count: Optional override of the service-wide prefetch_count
+        """
+        async def run_handler(data: dict) -> None:
+            await self._loop.run_in_executor(self._executor, handler, data)
+
+        self._run(self._service.register_consumer(queue_name, run_handler, prefetch_count))
+        self._consumers.add(queue_name)
+
+    def start_consuming_all(self) -> None:
+        """
+        Block until stop_consuming is called
+
+        Consumers already run on the event loop thread from the moment they
+        are registered; this only keeps the calling thread alive.
+        """
+        if not self._consumers:
+            self.logger.warning("No consumers registered")
+            return
+
+        self.logger.info(f"Consuming from {len(self._consumers)} queues")
+        try:
+            while not self._stop_event.wait(timeout=1):
+                pass  # Timed waits keep Ctrl+C deliverable on Windows
+        except KeyboardInterrupt:
+            self.logger.info("Stopping all consumers...")
+            self.stop_consuming()
+
+    def stop_consuming(self) -> None:
+        """Stop all consumers and release start_consuming_all"""
+        self._stop_event.set()
+        if self._consumers and not self._closed:
+            self._run(self._service.stop_consuming())
+            self._consumers.clear()
+
+    def close_connection(self) -> None:
+        """Stop consumers, close the connection and the event loop thread (safe to call more than once)"""
+        if self._closed:
+            return
+
+        self.stop_consuming()
+        try:
+            self._run(self._service.close_connection())
+        finally:
+            self._closed = True
+            # Running handlers complete their futures on the loop, so wait for them before stopping it
+            self._executor.shutdown(wait=True)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
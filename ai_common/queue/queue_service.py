@@ -33,6 +33,14 @@ class QueueService(ABC):
     def close_connection(self) -> None:
         """Close the connection to the queue service"""
         pass
+    
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close the connection"""
+        self.close_connection()
 
     @abstractmethod
     def start_consuming_all(self) -> None:
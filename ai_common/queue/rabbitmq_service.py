@@ -1,16 +1,115 @@
 """RabbitMQ implementation of QueueService"""
 
 import pika
-from pika.exceptions import AMQPConnectionError, AMQPChannelError
+from pika.exceptions import AMQPConnectionError, AMQPChannelError, ChannelClosedByBroker
 import json
 import logging
 import ssl
 import threading
 import functools
-import time
-from typing import Callable, Optional, Dict
+import collections
+import concurrent.futures
+import queue
+from typing import Callable, Optional, Dict, Set, Tuple
 from .queue_service import QueueService
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    # partial() keeps the hot path free of an extra Python frame per message
+    _dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+    _loads = orjson.loads
+else:
+    # Compact separators and raw UTF-8 instead of \u escapes, matching orjson's
+    # output. json.dumps builds a new encoder per call for non-default options
+    # like these, so it is built once here; decoding is the stdlib default
+    _encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+    _decode = json.JSONDecoder().decode
+    
+    def _dumps(payload: dict) -> bytes:
+        return _encode(payload).encode("utf-8")
+    
+    def _loads(body: bytes):
+        return _decode(body.decode("utf-8"))
+# Note: orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers catch both
+
+# Prebuilt publish arguments, shared by every message
+_DEFAULT_EXCHANGE = ""
+_CONTENT_TYPE = "application/json"
+_PERSISTENT_PROPS = pika.BasicProperties(delivery_mode=2, content_type=_CONTENT_TYPE)
+_TRANSIENT_PROPS = pika.BasicProperties(delivery_mode=1, content_type=_CONTENT_TYPE)
+
+# Seconds between consumer reconnect attempts, and max seconds to wait for
+# in-flight messages when stopping
+_RETRY_DELAY = 5
+_SHUTDOWN_TIMEOUT = 5
+
+# Ack batch size used when prefetch is unlimited (prefetch_count=0) and none is configured
+_DEFAULT_ACK_BATCH_SIZE = 32
+
+# (host, virtual_host, queue_name) of durable queues already declared by this process
+_DECLARED: Set[Tuple[str, str, str]] = set()
+
+
+@functools.lru_cache(maxsize=8)
+def _build_ssl_context(ca_cert_path: Optional[str],
+                       cert_path: Optional[str],
+                       key_path: Optional[str],
+                       verify_hostname: bool) -> ssl.SSLContext:
+    """
+    Build a client SSL context, reusing the one built for the same certificate files
+    
+    Args:
+        ca_cert_path: Path to CA certificate file
+        cert_path: Path to client certificate file
+        key_path: Path to client private key file
+        verify_hostname: Whether to verify hostname in TLS connection
+        
+    Returns:
+        Configured SSL context
+    """
+    ssl_context = ssl.create_default_context()
+    
+    # Load CA certificate if provided
+    if ca_cert_path:
+        ssl_context.load_verify_locations(cafile=ca_cert_path)
+    
+    # Load client certificate and key if provided
+    if cert_path and key_path:
+        ssl_context.load_cert_chain(cert_path, key_path)
+    
+    # Configure hostname verification
+    if not verify_hostname:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+@functools.lru_cache(maxsize=8)
+def _build_connection_params(host: str,
+                             port: int,
+                             virtual_host: str,
+                             username: str,
+                             password: str,
+                             ssl_context: Optional[ssl.SSLContext],
+                             heartbeat: int,
+                             blocked_connection_timeout: int) -> pika.ConnectionParameters:
+    """Build connection parameters, reusing the ones built for the same configuration"""
+    return pika.ConnectionParameters(
+        host=host,
+        port=port,
+        virtual_host=virtual_host,
+        credentials=pika.PlainCredentials(username, password),
+        ssl_options=pika.SSLOptions(ssl_context) if ssl_context else None,
+        heartbeat=heartbeat,
+        blocked_connection_timeout=blocked_connection_timeout
+    )
+
+
 class RabbitMQService(QueueService):
     """RabbitMQ implementation of the queue service"""
     
@@ -27,6 +126,12 @@ class RabbitMQService(QueueService):
                  verify_hostname: bool = False,
                  heartbeat: int = 30,
                  blocked_connection_timeout: int = 300,
+                 prefetch_count: int = 100,
+                 ack_batch_size: Optional[int] = None,
+                 ack_flush_interval: float = 0.05,
+                 publisher_confirms: bool = True,
+                 consumer_workers: int = 1,
+                 publisher_pool_size: int = 4,
                  logger: Optional[logging.Logger] = None):
         """
         Initialize RabbitMQ service
@@ -44,6 +149,15 @@ class RabbitMQService(QueueService):
             verify_hostname: Whether to verify hostname in TLS connection
             heartbeat: Heartbeat interval in seconds (default: 30)
             blocked_connection_timeout: Timeout for blocked connections in seconds (default: 300)
+            prefetch_count: Max unacknowledged messages per consumer (default: 100)
+            ack_batch_size: Number of processed messages acknowledged with a single frame
+                (default: half of the queue's prefetch_count)
+            ack_flush_interval: Seconds after which a partial ack batch is flushed (default: 0.05)
+            publisher_confirms: Wait for broker confirmation of each published message (default: True)
+            consumer_workers: Handler threads per consumer; values above 1 run a queue's
+                handlers concurrently (default: 1, handlers run one at a time)
+            publisher_pool_size: Max long-lived publisher connections shared by
+                publishing threads (default: 4)
             logger: Optional logger instance
         """
         self.host = host
@@ -58,88 +172,181 @@ class RabbitMQService(QueueService):
         self.cert_path = cert_path
         self.key_path = key_path
         self.verify_hostname = verify_hostname
-        self.credentials = pika.PlainCredentials(username, password)
+        self.prefetch_count = prefetch_count
+        self.ack_batch_size = ack_batch_size
+        self.ack_flush_interval = ack_flush_interval
+        self.publisher_confirms = publisher_confirms
+        self.consumer_workers = consumer_workers
+        self.publisher_pool_size = publisher_pool_size
         
-        # Configure SSL context if TLS is enabled
+        # SSL context and connection parameters are shared by services with the same
+        # configuration, so certificates are only read from disk once per process
         ssl_context = None
         if self.use_tls:
-            ssl_context = ssl.create_default_context()
-            
-            # Load CA certificate if provided
-            if self.ca_cert_path:
-                ssl_context.load_verify_locations(cafile=self.ca_cert_path)
-            
-            # Load client certificate and key if provided
-            if self.cert_path and self.key_path:
-                ssl_context.load_cert_chain(self.cert_path, self.key_path)
-            
-            # Configure hostname verification
-            if not self.verify_hostname:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
+            ssl_context = _build_ssl_context(ca_cert_path, cert_path, key_path, verify_hostname)
         
-        self.connection_params = pika.ConnectionParameters(
-            host=self.host,
-            port=self.port,
-            virtual_host=self.virtual_host,
-            credentials=self.credentials,
-            ssl_options=pika.SSLOptions(ssl_context) if ssl_context else None,
-            heartbeat=heartbeat,
-            blocked_connection_timeout=blocked_connection_timeout
+        self.connection_params = _build_connection_params(
+            self.host, self.port, self.virtual_host, username, password,
+            ssl_context, heartbeat, blocked_connection_timeout
         )
+        self.credentials = self.connection_params.credentials
         self.logger = logger or logging.getLogger(__name__)
-        self._connection = None
-        self._consumers = {}  # Store consumer threads
-        self._consumer_threads = []  # Store thread references
-        self._stop_consuming = False
+        # Idle (connection, channel) publisher pairs; a BlockingConnection is not
+        # thread-safe, so each pair is used by one publishing thread at a time
+        self._pub_pool = queue.Queue(maxsize=publisher_pool_size)
+        # One permit per publishing thread holding a pair; discarding a broken
+        # pair releases its permit, so waiters are woken whenever a slot frees up
+        self._pub_slots = threading.BoundedSemaphore(publisher_pool_size)
+        self._consumers = {}  # Registered handlers per queue
+        self._prefetch_counts = {}  # Per-queue prefetch overrides
+        self._executors = {}  # Handler thread pool per queue
+        self._consumer_connection = None  # SelectConnection shared by all consumers
+        self._consumer_states = {}  # _ConsumerState per queue for the current connection
+        self._opening_channels = set()  # Queues whose channel is opening but not consuming yet
+        self._io_thread_ident = None
+        self._consuming_stopped = threading.Event()
+        self._consuming_stopped.set()
+        # Handler results waiting for the I/O loop; workers schedule at most one drain
+        # at a time, on the loop of the connection recorded in _drain_scheduled_on
+        self._settled = collections.deque()
+        self._drain_scheduled_on = None
+        self._settle_lock = threading.Lock()
+        self._stop_event = threading.Event()  # Set by stop_consuming, wakes reconnect waits
+        self._shutdown_timer = None  # Deadline timer of a graceful consumer shutdown
         
         # Log heartbeat configuration
-        self.logger.info(f"RabbitMQ service initialized with heartbeat={heartbeat}s, blocked_timeout={blocked_connection_timeout}s")
+        self.logger.info(f"RabbitMQ service initialized with heartbeat={heartbeat}s, blocked_timeout={blocked_connection_timeout}s, prefetch_count={prefetch_count}")
         
-    def _get_connection(self):
-        """Get or create a connection to RabbitMQ"""
-        if self._connection is None or self._connection.is_closed:
-            self._connection = pika.BlockingConnection(self.connection_params)
-        return self._connection
+    def _open_publisher(self):
+        """Open a new publisher connection and channel"""
+        connection = pika.BlockingConnection(self.connection_params)
+        channel = connection.channel()
+        if self.publisher_confirms:
+            channel.confirm_delivery()
+        return connection, channel
+
+    def _checkout_publisher(self, fresh: bool = False):
+        """
+        Take a publisher (connection, channel) pair from the pool
+        Blocks while publisher_pool_size threads hold a pair, then reuses an
+        idle pair or opens a new one. Hand the pair back with _return_publisher
+        or _discard_publisher
+        
+        Args:
+            fresh: Always open a new pair instead of reusing an idle one
+        """
+        self._pub_slots.acquire()
+        try:
+            while True:
+                try:
+                    if fresh:
+                        raise queue.Empty
+                    connection, channel = self._pub_pool.get_nowait()
+                except queue.Empty:
+                    # Idle pairs + held pairs never exceed the permits, so opening stays within the pool size
+                    return self._open_publisher()
+                if channel.is_open:
+                    return connection, channel
+                self._close_publisher(connection)
+        except BaseException:
+            self._pub_slots.release()
+            raise
+
+    def _return_publisher(self, connection, channel) -> None:
+        """Put a healthy publisher pair back into the pool and free its slot"""
+        self._pub_pool.put_nowait((connection, channel))
+        self._pub_slots.release()
+
+    def _discard_publisher(self, connection) -> None:
+        """Close a broken publisher connection and free its pool slot"""
+        self._close_publisher(connection)
+        self._pub_slots.release()
 
-    def publish(self, queue_name: str, payload: dict) -> None:
+    def _close_idle_publishers(self) -> int:
+        """Close all idle pooled publisher connections and return how many were closed"""
+        closed = 0
+        while True:
+            try:
+                connection, _ = self._pub_pool.get_nowait()
+            except queue.Empty:
+                return closed
+            self._close_publisher(connection)
+            closed += 1
+
+    def _close_publisher(self, connection) -> None:
+        """Close a publisher connection, ignoring errors"""
+        if not connection.is_closed:
+            try:
+                connection.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing publisher connection: {str(e)}")
+
+    def publish(self, queue_name: str, payload: dict, persistent: bool = True) -> None:
         """
         Publish a message to the specified queue
         
         Args:
             queue_name: Name of the queue to publish to
             payload: Message payload as dictionary
+            persistent: Whether the broker should persist the message to disk (default: True)
         """
         try:
-            connection = pika.BlockingConnection(self.connection_params)
-            channel = connection.channel()
-            
-            # Declare queue with durability
-            channel.queue_declare(queue=queue_name, durable=True)
+            body = _dumps(payload)
+            properties = _PERSISTENT_PROPS if persistent else _TRANSIENT_PROPS
+            declared_key = (self.host, self.virtual_host, queue_name)
             
-            # Publish message with persistence
-            channel.basic_publish(
-                exchange="",
-                routing_key=queue_name,
-                body=json.dumps(payload),
-                properties=pika.BasicProperties(delivery_mode=2)  # Make message persistent
-            )
+            # Retry once on a fresh connection if the pooled one went stale
+            for attempt in range(2):
+                connection, channel = self._checkout_publisher(fresh=bool(attempt))
+                try:
+                    # Declare queue with durability (once per queue)
+                    if declared_key not in _DECLARED:
+                        channel.queue_declare(queue=queue_name, durable=True)
+                        _DECLARED.add(declared_key)
+                    
+                    channel.basic_publish(
+                        exchange=_DEFAULT_EXCHANGE,
+                        routing_key=queue_name,
+                        body=body,
+                        properties=properties
+                    )
+                except (AMQPConnectionError, AMQPChannelError) as e:
+                    self._discard_publisher(connection)
+                    if isinstance(e, AMQPConnectionError):
+                        # Idle pooled connections process no heartbeats, so a broker
+                        # restart or heartbeat timeout has most likely dropped them too
+                        self._close_idle_publishers()
+                    if isinstance(e, ChannelClosedByBroker):
+                        # Queue may have been deleted or redeclared with other arguments
+                        _DECLARED.discard(declared_key)
+                    if attempt:
+                        raise
+                    self.logger.warning(f"Publisher connection lost, reconnecting: {str(e)}")
+                    continue
+                except Exception:
+                    # e.g. a negative publisher confirm; the channel is still usable
+                    self._return_publisher(connection, channel)
+                    raise
+                self._return_publisher(connection, channel)
+                break
             
-            connection.close()
             self.logger.info(f"Message published to queue '{queue_name}'")
             
         except Exception as e:
             self.logger.error(f"Error publishing message to queue '{queue_name}': {str(e)}")
             raise
 
-    def register_consumer(self, queue_name: str, handler: Callable[[dict], None]) -> None:
+    def register_consumer(self, queue_name: str, handler: Callable[[dict], None],
+                          prefetch_count: Optional[int] = None) -> None:
         """
         Register a consumer handler for the specified queue
-        Each consumer will run in its own thread with its own connection
+        All queues are consumed over a single connection once start_consuming_all
+        runs; handlers are executed on a per-queue thread pool
         
         Args:
             queue_name: Name of the queue to consume from
             handler: Callback function to handle incoming messages
+            prefetch_count: Optional override of the service-wide prefetch_count
         """
         if queue_name in self._consumers:
             self.logger.warning(f"Consumer for queue '{queue_name}' already registered. Skipping.")
@@ -147,193 +354,327 @@ class RabbitMQService(QueueService):
             
         # Store consumer info
         self._consumers[queue_name] = handler
+        if prefetch_count is not None:
+            self._prefetch_counts[queue_name] = prefetch_count
         
-        # Create and start consumer thread
-        consumer_thread = threading.Thread(
-            target=self._run_consumer,
-            args=(queue_name, handler),
-            daemon=True,
-            name=f"Consumer-{queue_name}"
-        )
-        self._consumer_threads.append(consumer_thread)
-        consumer_thread.start()
-        
-        self.logger.info(f"Consumer registered and started for queue '{queue_name}'")
-
-    def _run_consumer(self, queue_name: str, handler: Callable[[dict], None]) -> None:
-        """
-        Run consumer in its own thread with its own connection and auto-recovery
-        
-        Args:
-            queue_name: Name of the queue to consume from
-            handler: Callback function to handle incoming messages
-        """
-        retry_count = 0
-        max_retries = 10  # Increased to 10 retries as requested
-        base_retry_delay = 5  # Changed to 5 seconds as requested
+        # Already consuming: open the channel from the I/O loop thread
+        connection = self._consumer_connection
+        if connection is not None and connection.is_open:
+            connection.ioloop.add_callback_threadsafe(
+                functools.partial(self._open_consumer_channel, connection, queue_name)
+            )
         
-        while not self._stop_consuming:
-            connection = None
-            channel = None
-            try:
-                # Try to establish connection
-                self.logger.info(f"Attempting to connect to RabbitMQ for queue '{queue_name}' (attempt {retry_count + 1}/{max_retries})")
-                connection = pika.BlockingConnection(self.connection_params)
-                channel = connection.channel()
-                channel.queue_declare(queue=queue_name, durable=True)
-                channel.basic_qos(prefetch_count=1)
-
-                def callback(ch, method, properties, body):
-                    try:
-                        data = json.loads(body)
-                        handler(data)
-                        ch.basic_ack(delivery_tag=method.delivery_tag)
-                        self.logger.debug(f"Message processed successfully from queue '{queue_name}'")
-                    except json.JSONDecodeError as e:
-                        self.logger.error(f"Error parsing JSON message from queue '{queue_name}': {str(e)}")
-                        try:
-                            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-                        except Exception:
-                            pass  # Channel might be closed
-                    except Exception as e:
-                        self.logger.error(f"Error handling message from queue '{queue_name}': {str(e)}")
-                        try:
-                            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-                        except Exception:
-                            pass  # Channel might be closed
-
-                channel.basic_consume(queue=queue_name, on_message_callback=callback)
-                self.logger.info(f"Consumer started for queue '{queue_name}' in thread {threading.current_thread().name}")
-                
-                # Reset retry count on successful connection
-                retry_count = 0
-
-                # Main consumer loop
-                while not self._stop_consuming:
-                    try:
-                        connection.process_data_events(time_limit=1)
-                    except (AMQPConnectionError, AMQPChannelError, ConnectionResetError, OSError) as e:
-                        if not self._stop_consuming:
-                            self.logger.warning(f"Connection/Channel lost for queue '{queue_name}': {str(e)}")
-                            break  # Break to outer loop for reconnection
-                    except Exception as e:
-                        if not self._stop_consuming:
-                            self.logger.error(f"Error in consumer for queue '{queue_name}': {str(e)}")
-                            break  # Break to outer loop for reconnection
-
-                # Clean exit from consumer loop
-                if self._stop_consuming:
-                    self.logger.info(f"Consumer stopped for queue '{queue_name}'")
-                    break
-                    
-            except Exception as e:
-                if self._stop_consuming:
-                    break
-                    
-                retry_count += 1
-                self.logger.error(f"Error setting up consumer for queue '{queue_name}' (attempt {retry_count}/{max_retries}): {str(e)}")
-                
-                if retry_count >= max_retries:
-                    self.logger.error(f"Max retries ({max_retries}) reached for consumer '{queue_name}'. Waiting {base_retry_delay}s before resetting retry count...")
-                    time.sleep(base_retry_delay)
-                    retry_count = 0  # Reset retry count to continue trying indefinitely
-                else:
-                    self.logger.info(f"Retrying consumer for queue '{queue_name}' in {base_retry_delay} seconds...")
-                    time.sleep(base_retry_delay)
-                    
-            finally:
-                # Always cleanup connections
-                if channel:
-                    try:
-                        channel.stop_consuming()
-                    except Exception as e:
-                        self.logger.debug(f"Error during channel cleanup for queue '{queue_name}': {str(e)}")
-                if connection and not connection.is_closed:
-                    try:
-                        connection.close()
-                    except Exception as e:
-                        self.logger.debug(f"Error during connection cleanup for queue '{queue_name}': {str(e)}")
-                        
-        self.logger.info(f"Consumer thread for queue '{queue_name}' has exited")
+        self.logger.info(f"Consumer registered for queue '{queue_name}'")
 
     def start_consuming_all(self) -> None:
         """
         Start consuming from all registered queues
-        This is a blocking call that keeps the main thread alive
+        This is a blocking call that runs the consumer I/O loop on the calling
+        thread and reconnects automatically until stop_consuming is called
         """
-        if not self._consumer_threads:
+        if not self._consumers:
             self.logger.warning("No consumers registered")
             return
             
-        self.logger.info(f"Started {len(self._consumer_threads)} consumers")
+        self.logger.info(f"Starting {len(self._consumers)} consumers")
+        self._consuming_stopped.clear()
+        self._io_thread_ident = threading.get_ident()
         
         try:
-            # Keep main thread alive while consumers run
-            while not self._stop_consuming:
-                time.sleep(1)
-                
-                # Check if any consumer threads have died and restart them
-                for i, thread in enumerate(self._consumer_threads):
-                    if not thread.is_alive():
-                        queue_name = thread.name.replace("Consumer-", "")
-                        self.logger.warning(f"Consumer thread {thread.name} died, restarting...")
-                        
-                        # Find the handler for this queue
-                        if queue_name in self._consumers:
-                            handler = self._consumers[queue_name]
-                            
-                            # Create and start a new consumer thread
-                            new_thread = threading.Thread(
-                                target=self._run_consumer,
-                                args=(queue_name, handler),
-                                daemon=True,
-                                name=f"Consumer-{queue_name}"
-                            )
-                            self._consumer_threads[i] = new_thread
-                            new_thread.start()
-                            self.logger.info(f"Restarted consumer thread for queue '{queue_name}'")
-                        
+            while not self._stop_event.is_set():
+                self._consumer_states = {}
+                self._opening_channels = set()
+                self._shutdown_timer = None
+                connection = pika.SelectConnection(
+                    self.connection_params,
+                    on_open_callback=self._on_consumer_connection_open,
+                    on_open_error_callback=self._on_consumer_connection_error,
+                    on_close_callback=self._on_consumer_connection_closed
+                )
+                self._set_consumer_connection(connection)
+                try:
+                    connection.ioloop.start()
+                except KeyboardInterrupt:
+                    self.logger.info("Stopping all consumers...")
+                    self._stop_event.set()
+                    self._shutdown_consumers(connection)
+                    connection.ioloop.start()  # Run until the connection has closed
+                finally:
+                    # Each connection has its own I/O loop; release its poller and wake sockets
+                    connection.ioloop.close()
+                    
+                if not self._stop_event.is_set():
+                    self.logger.info(f"Reconnecting consumers in {_RETRY_DELAY} seconds...")
+                    self._stop_event.wait(_RETRY_DELAY)
+                    
         except KeyboardInterrupt:
             self.logger.info("Stopping all consumers...")
-            self.stop_consuming()
+            self._stop_event.set()
+            
+        finally:
+            self._set_consumer_connection(None)
+            self._consumer_states = {}
+            # Let running handlers finish; queued messages are skipped since their channels are closed
+            for executor in self._executors.values():
+                executor.shutdown(wait=True)
+            self._executors.clear()
+            self._io_thread_ident = None
+            self._consuming_stopped.set()
+            self.logger.info("All consumers stopped")
+
+    def _set_consumer_connection(self, connection) -> None:
+        """
+        Make a connection the current consumer connection
+        Results and drains of the previous connection can no longer be settled,
+        so they are dropped together under the settle lock
+        """
+        with self._settle_lock:
+            self._consumer_connection = connection
+            self._settled.clear()
+            self._drain_scheduled_on = None
 
     def stop_consuming(self) -> None:
         """Stop all consumers"""
-        self._stop_consuming = True
+        self._stop_event.set()
+        
+        connection = self._consumer_connection
+        if connection is None:
+            return
+            
+        try:
+            connection.ioloop.add_callback_threadsafe(
+                functools.partial(self._shutdown_consumers, connection)
+            )
+        except Exception as e:
+            self.logger.debug(f"Error scheduling consumer shutdown: {str(e)}")
+            
+        # Wait for the I/O loop to wind down, unless called from the loop itself
+        if threading.get_ident() != self._io_thread_ident:
+            self._consuming_stopped.wait(timeout=_SHUTDOWN_TIMEOUT + 1)
+
+    def _on_consumer_connection_open(self, connection) -> None:
+        """Open one channel per registered queue once the connection is up"""
+        self.logger.info(f"Consumer connection opened to {self.host}:{self.port}")
+        for queue_name in list(self._consumers):
+            self._open_consumer_channel(connection, queue_name)
+
+    def _on_consumer_connection_error(self, connection, error) -> None:
+        """Connection attempt failed; leave the I/O loop so start_consuming_all retries"""
+        self.logger.error(f"Error connecting consumers to RabbitMQ: {str(error)}")
+        connection.ioloop.stop()
+
+    def _on_consumer_connection_closed(self, connection, reason) -> None:
+        """Connection closed; leave the I/O loop so start_consuming_all reconnects or returns"""
+        if not self._stop_event.is_set():
+            self.logger.warning(f"Consumer connection lost: {str(reason)}")
+        connection.ioloop.stop()
+
+    def _open_consumer_channel(self, connection, queue_name: str) -> None:
+        """Open the channel of a queue consumer (I/O loop thread)"""
+        if self._stop_event.is_set() or not connection.is_open:
+            return
+        # A registration from another thread may race with the connection-open callback
+        if queue_name in self._consumer_states or queue_name in self._opening_channels:
+            return
+        self._opening_channels.add(queue_name)
+        connection.channel(on_open_callback=functools.partial(self._on_consumer_channel_open, queue_name))
+
+    def _on_consumer_channel_open(self, queue_name: str, channel) -> None:
+        """Declare the queue (once per process) and continue with basic_qos"""
+        channel.add_on_close_callback(functools.partial(self._on_consumer_channel_closed, queue_name))
+        declared_key = (self.host, self.virtual_host, queue_name)
+        if declared_key in _DECLARED:
+            self._set_consumer_qos(queue_name, channel)
+        else:
+            channel.queue_declare(
+                queue=queue_name,
+                durable=True,
+                callback=functools.partial(self._on_consumer_queue_declared, queue_name, channel)
+            )
+
+    def _on_consumer_queue_declared(self, queue_name: str, channel, frame) -> None:
+        """Remember the declaration and continue with basic_qos"""
+        _DECLARED.add((self.host, self.virtual_host, queue_name))
+        self._set_consumer_qos(queue_name, channel)
+
+    def _set_consumer_qos(self, queue_name: str, channel) -> None:
+        """Apply the queue's prefetch window to its channel"""
+        prefetch_count = self._prefetch_counts.get(queue_name, self.prefetch_count)
+        channel.basic_qos(
+            prefetch_count=prefetch_count,
+            callback=functools.partial(self._on_consumer_qos_ok, queue_name, channel, prefetch_count)
+        )
+
+    def _on_consumer_qos_ok(self, queue_name: str, channel, prefetch_count: int, frame) -> None:
+        """Start delivering messages for the queue"""
+        if queue_name not in self._executors:
+            # Handlers run off the I/O thread so network reads and acks overlap with handler CPU
+            self._executors[queue_name] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.consumer_workers,
+                thread_name_prefix=f"Handler-{queue_name}"
+            )
+            if prefetch_count and prefetch_count < 2 * self.consumer_workers:
+                self.logger.warning(f"prefetch_count={prefetch_count} for queue '{queue_name}' is below twice "
+                                    f"consumer_workers={self.consumer_workers}; handler threads will sit idle")
+        # A multiple=True ack batch never exceeds the prefetch window or the broker would stall
+        ack_batch_size = self.ack_batch_size or prefetch_count // 2 or _DEFAULT_ACK_BATCH_SIZE
+        if prefetch_count:
+            ack_batch_size = max(1, min(ack_batch_size, prefetch_count))
+        state = _ConsumerState(channel, ack_batch_size)
+        self._consumer_states[queue_name] = state
+        self._opening_channels.discard(queue_name)
+        state.consumer_tag = channel.basic_consume(
+            queue=queue_name,
+            on_message_callback=functools.partial(self._on_consumer_message, queue_name)
+        )
+        self.logger.info(f"Consumer started for queue '{queue_name}'")
+
+    def _on_consumer_channel_closed(self, queue_name: str, channel, reason) -> None:
+        """Forget the channel state and reopen it unless the whole consumer is going away"""
+        state = self._consumer_states.get(queue_name)
+        if state is not None and state.channel is channel:
+            del self._consumer_states[queue_name]
+        else:
+            self._opening_channels.discard(queue_name)  # Closed before consuming started
+            
+        if self._stop_event.is_set():
+            return
+            
+        _DECLARED.discard((self.host, self.virtual_host, queue_name))  # Re-declare on reopen
+        connection = self._consumer_connection
+        if connection is not None and connection.is_open:
+            self.logger.warning(f"Channel for queue '{queue_name}' closed: {str(reason)}. Reopening in {_RETRY_DELAY} seconds...")
+            connection.ioloop.call_later(
+                _RETRY_DELAY,
+                functools.partial(self._open_consumer_channel, connection, queue_name)
+            )
+
+    def _on_consumer_message(self, queue_name: str, channel, method, properties, body) -> None:
+        """Hand a delivery to the queue's handler pool (I/O loop thread)"""
+        state = self._consumer_states.get(queue_name)
+        if state is None or state.channel is not channel:
+            return  # Stale channel; the broker redelivers the message
+        state.in_flight.append(method.delivery_tag)
+        self._executors[queue_name].submit(
+            self._process_message_threaded,
+            self._consumer_connection, channel, queue_name, method.delivery_tag, body, self._consumers[queue_name]
+        )
+
+    def _settle_message(self, channel, queue_name: str, delivery_tag: int, error: Optional[Exception]) -> None:
+        """
+        Record a handler result and settle finished messages (I/O loop thread)
+        Messages are settled strictly in delivery order so a multiple=True ack
+        never covers a message that is still being handled
+        """
+        state = self._consumer_states.get(queue_name)
+        if state is None or state.channel is not channel:
+            return  # Channel was closed; the broker redelivers the message
+            
+        state.finished[delivery_tag] = error
+        while state.in_flight and state.in_flight[0] in state.finished:
+            tag = state.in_flight.popleft()
+            if state.finished.pop(tag) is None:
+                state.last_delivery_tag = tag
+                state.pending_acks += 1
+            else:
+                # Flush first so the multiple=True ack cannot cover this tag
+                self._flush_acks(state)
+                self._nack_message(self._consumer_connection, channel, tag, False)
+                
+        if state.pending_acks >= state.ack_batch_size:
+            self._flush_acks(state)
+        elif state.pending_acks and state.flush_timer is None:
+            state.flush_timer = self._consumer_connection.ioloop.call_later(
+                self.ack_flush_interval, functools.partial(self._on_ack_timer, state)
+            )
+            
+        # Graceful shutdown waits for the last in-flight message
+        if self._shutdown_timer is not None and not any(s.in_flight for s in self._consumer_states.values()):
+            self._close_consumer_connection(self._consumer_connection)
+
+    def _drain_settled(self) -> None:
+        """Settle every queued handler result (I/O loop thread)"""
+        # Reset the flag before draining so results queued meanwhile schedule a new drain
+        with self._settle_lock:
+            self._drain_scheduled_on = None
+        while True:
+            try:
+                channel, queue_name, delivery_tag, error = self._settled.popleft()
+            except IndexError:
+                break
+            self._settle_message(channel, queue_name, delivery_tag, error)
+
+    def _on_ack_timer(self, state: "_ConsumerState") -> None:
+        """Flush a partial ack batch after ack_flush_interval"""
+        state.flush_timer = None
+        self._flush_acks(state)
+
+    def _flush_acks(self, state: "_ConsumerState") -> None:
+        """Acknowledge all settled successes of a channel with one frame"""
+        if state.flush_timer is not None:
+            self._consumer_connection.ioloop.remove_timeout(state.flush_timer)
+            state.flush_timer = None
+        if state.pending_acks:
+            self._ack_message(self._consumer_connection, state.channel, state.last_delivery_tag, multiple=True)
+            state.pending_acks = 0
+
+    def _shutdown_consumers(self, connection) -> None:
+        """Cancel all consumers, let in-flight messages settle, then close (I/O loop thread)"""
+        for queue_name, state in self._consumer_states.items():
+            if state.channel.is_open and state.consumer_tag:
+                try:
+                    state.channel.basic_cancel(state.consumer_tag)
+                except Exception as e:
+                    self.logger.debug(f"Error cancelling consumer for queue '{queue_name}': {str(e)}")
         
-        # Wait for all consumer threads to finish
-        for thread in self._consumer_threads:
-            if thread.is_alive():
-                thread.join(timeout=5)
+        # Close as soon as the last in-flight message settles, or at the deadline
+        if self._shutdown_timer is None:
+            self._shutdown_timer = connection.ioloop.call_later(
+                _SHUTDOWN_TIMEOUT, functools.partial(self._close_consumer_connection, connection)
+            )
+        if not any(state.in_flight for state in self._consumer_states.values()):
+            self._close_consumer_connection(connection)
+
+    def _close_consumer_connection(self, connection) -> None:
+        """Flush pending acks and close the consumer connection (I/O loop thread)"""
+        if self._shutdown_timer is not None:
+            connection.ioloop.remove_timeout(self._shutdown_timer)
+            
+        for queue_name, state in list(self._consumer_states.items()):
+            try:
+                self._flush_acks(state)
+            except Exception as e:
+                self.logger.debug(f"Error flushing pending acks for queue '{queue_name}': {str(e)}")
                 
-        self.logger.info("All consumers stopped")
+        if connection.is_closed:
+            connection.ioloop.stop()
+        elif not connection.is_closing:
+            connection.close()
 
     def close_connection(self) -> None:
-        """Close all connections and stop consumers"""
+        """Close all connections and stop consumers (safe to call more than once)"""
         self.stop_consuming()
         
-        if self._connection and not self._connection.is_closed:
-            self._connection.close()
-            self.logger.info("RabbitMQ connection closed")
-            
-    def __del__(self):
-        """Destructor to ensure connections are closed"""
-        self.close_connection()
+        # Close idle publisher connections; pairs checked out by publishing
+        # threads are returned to the pool afterwards and reused on demand
+        closed = self._close_idle_publishers()
+        if closed:
+            self.logger.info(f"RabbitMQ connection closed ({closed} publisher connections)")
 
-    def _ack_message(self, connection, channel, delivery_tag):
+    def _ack_message(self, connection, channel, delivery_tag, multiple=False):
         """
-        Acknowledge message using connection callback (thread-safe)
+        Acknowledge message(s) from the connection's I/O loop thread
         Based on pika's threaded consumer pattern
         """
         if channel.is_open:
-            channel.basic_ack(delivery_tag)
+            channel.basic_ack(delivery_tag, multiple=multiple)
         else:
             # Channel is already closed, log it
             self.logger.warning(f"Cannot ACK message {delivery_tag}: channel is closed")
     
     def _nack_message(self, connection, channel, delivery_tag, requeue=False):
         """
-        Negative acknowledge message using connection callback (thread-safe)
+        Negative acknowledge message from the connection's I/O loop thread
         """
         if channel.is_open:
             channel.basic_nack(delivery_tag, requeue=requeue)
@@ -341,31 +682,63 @@ class RabbitMQService(QueueService):
             # Channel is already closed, log it
             self.logger.warning(f"Cannot NACK message {delivery_tag}: channel is closed")
     
-    def _process_message_threaded(self, connection, channel, delivery_tag, body, handler):
+    def _process_message_threaded(self, connection, channel, queue_name, delivery_tag, body, handler):
         """
-        Process message in a separate thread and safely acknowledge
-        This prevents blocking the consumer thread
+        Process message in a separate thread and hand the result back to the I/O loop
+        This prevents blocking the consumer I/O thread
         """
+        if not channel.is_open:
+            return  # Queued before the channel closed; the broker redelivers the message
+            
         thread_id = threading.get_ident()
+        error = None
         try:
             # Parse message body
-            data = json.loads(body)
+            data = _loads(body)
             
             # Call user handler
             handler(data)
             
-            # Acknowledge message safely using connection callback
-            ack_callback = functools.partial(self._ack_message, connection, channel, delivery_tag)
-            connection.add_callback_threadsafe(ack_callback)
-            
-            self.logger.debug(f"Message processed successfully in thread {thread_id}, delivery_tag: {delivery_tag}")
+            # Per-message hot path: skip formatting entirely unless debug logging is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Message processed successfully in thread %s, delivery_tag: %s", thread_id, delivery_tag)
             
         except json.JSONDecodeError as e:
-            self.logger.error(f"Error parsing JSON message in thread {thread_id}: {str(e)}")
-            nack_callback = functools.partial(self._nack_message, connection, channel, delivery_tag, False)
-            connection.add_callback_threadsafe(nack_callback)
+            self.logger.error(f"Error parsing JSON message from queue '{queue_name}' in thread {thread_id}: {str(e)}")
+            error = e
+            
+        except Exception as e:
+            self.logger.error(f"Error handling message from queue '{queue_name}' in thread {thread_id}: {str(e)}")
+            error = e
             
+        # Channels are not thread-safe: settle the message on the I/O loop thread.
+        # Results are queued and drained by a single coalesced callback, so a
+        # burst of completions costs one I/O loop wake-up instead of one each
+        with self._settle_lock:
+            if connection is not self._consumer_connection:
+                return  # Delivered on a connection that is gone; the broker redelivers the message
+            self._settled.append((channel, queue_name, delivery_tag, error))
+            if self._drain_scheduled_on is connection:
+                return
+            self._drain_scheduled_on = connection
+        try:
+            connection.ioloop.add_callback_threadsafe(self._drain_settled)
         except Exception as e:
-            self.logger.error(f"Error handling message in thread {thread_id}: {str(e)}")
-            nack_callback = functools.partial(self._nack_message, connection, channel, delivery_tag, False)
-            connection.add_callback_threadsafe(nack_callback)
+            with self._settle_lock:
+                if self._drain_scheduled_on is connection:
+                    self._drain_scheduled_on = None
+            self.logger.debug(f"Cannot settle message {delivery_tag}, connection is gone: {str(e)}")
+
+
+class _ConsumerState:
+    """Per-channel consumer bookkeeping, only touched from the I/O loop thread"""
+    
+    def __init__(self, channel, ack_batch_size: int):
+        self.channel = channel
+        self.ack_batch_size = ack_batch_size
+        self.consumer_tag = None
+        self.in_flight = collections.deque()  # Delivery tags in delivery order
+        self.finished = {}  # delivery_tag -> handler exception (None on success)
+        self.pending_acks = 0
+        self.last_delivery_tag = None
+        self.flush_timer = None
@@ -1,8 +1,10 @@
 """GPU Memory monitoring and management utilities"""
 
+import contextlib
 import gc
+import itertools
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 try:
     import torch
@@ -10,6 +12,42 @@ try:
 except ImportError:
     TORCH_AVAILABLE = False
 
+if TORCH_AVAILABLE:
+    # Bound once so hot monitoring paths skip the torch.cuda attribute lookups;
+    # binding does not initialize CUDA
+    _memory_allocated = torch.cuda.memory_allocated
+    _memory_reserved = torch.cuda.memory_reserved
+    _empty_cache = torch.cuda.empty_cache
+    _synchronize = torch.cuda.synchronize
+
+# CUDA availability and device name, resolved on first use (None = not probed yet)
+_CUDA_AVAILABLE: Optional[bool] = None
+_DEVICE_NAME: Optional[str] = None
+
+
+def _cuda_state() -> Tuple[bool, Optional[str]]:
+    """
+    Get CUDA availability and the name of device 0, probing the driver only once
+    
+    CUDA is treated as unavailable if the probe fails, e.g. in a forked worker
+    after the parent initialized CUDA, where is_available() is still True but
+    get_device_name() raises.
+    
+    Returns:
+        Tuple of (CUDA available, device name or None)
+    """
+    global _CUDA_AVAILABLE, _DEVICE_NAME
+    if _CUDA_AVAILABLE is None:
+        try:
+            available = TORCH_AVAILABLE and torch.cuda.is_available()
+            _DEVICE_NAME = torch.cuda.get_device_name(0) if available else None
+        except Exception as e:
+            logging.warning(f"Error probing CUDA device, treating CUDA as unavailable: {str(e)}")
+            available = False
+            _DEVICE_NAME = None
+        _CUDA_AVAILABLE = available
+    return _CUDA_AVAILABLE, _DEVICE_NAME
+
 
 class GPUMemoryUtils:
     """Utilities for GPU memory monitoring and management"""
@@ -30,59 +68,81 @@ class GPUMemoryUtils:
         if not TORCH_AVAILABLE:
             return None
             
-        if torch.cuda.is_available():
+        cuda_available, device_name = _cuda_state()
+        if cuda_available:
             try:
                 return {
-                    'allocated': torch.cuda.memory_allocated() / (1024**3),  # Convert to GB
-                    'reserved': torch.cuda.memory_reserved() / (1024**3),    # Convert to GB
-                    'device': torch.cuda.get_device_name(0)
+                    'allocated': _memory_allocated() / (1024**3),  # Convert to GB
+                    'reserved': _memory_reserved() / (1024**3),    # Convert to GB
+                    'device': device_name
                 }
             except Exception as e:
                 logging.warning(f"Error getting GPU memory usage: {str(e)}")
                 return None
         return None
     
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget the cached CUDA availability and device name so they are probed again"""
+        global _CUDA_AVAILABLE, _DEVICE_NAME
+        _CUDA_AVAILABLE = None
+        _DEVICE_NAME = None
+    
     @staticmethod
-    def clear_gpu_memory(logger: Optional[logging.Logger] = None) -> None:
+    def clear_gpu_memory(logger: Optional[logging.Logger] = None,
+                         synchronize: bool = False,
+                         full_gc: bool = False) -> None:
         """
         Clear GPU memory cache
         
         Args:
             logger: Optional logger instance for debugging
+            synchronize: Block until all queued CUDA work has finished before
+                releasing the cache (default: False)
+            full_gc: Run a full Python garbage collection first, so tensors only
+                held by reference cycles are freed (default: False)
         """
         if not TORCH_AVAILABLE:
             return
             
         log = logger or logging.getLogger(__name__)
         
-        if torch.cuda.is_available():
+        if _cuda_state()[0]:
             try:
-                gpu_before = GPUMemoryUtils.get_gpu_memory_usage()
-                if gpu_before and logger:
+                # Memory is only queried when it is logged
+                gpu_before = GPUMemoryUtils.get_gpu_memory_usage() if logger else None
+                if gpu_before:
                     log.info(f"GPU Memory before clear - Allocated: {gpu_before['allocated']:.2f}GB, Reserved: {gpu_before['reserved']:.2f}GB")
                 
-                # Force garbage collection and clear CUDA cache
-                gc.collect()
-                torch.cuda.empty_cache()
-                torch.cuda.synchronize()
+                # Release cached blocks; empty_cache waits for blocks still in use by
+                # other streams (record_stream), e.g. pending offload copies
+                if full_gc:
+                    gc.collect()
+                if synchronize:
+                    _synchronize()
+                _empty_cache()
                 
-                gpu_after = GPUMemoryUtils.get_gpu_memory_usage()
-                if gpu_after and logger:
+                gpu_after = GPUMemoryUtils.get_gpu_memory_usage() if logger else None
+                if gpu_after:
                     log.info(f"GPU Memory after clear - Allocated: {gpu_after['allocated']:.2f}GB, Reserved: {gpu_after['reserved']:.2f}GB")
                     
             except Exception as e:
                 log.warning(f"Error clearing GPU memory: {str(e)}")
     
     @staticmethod
-    def log_gpu_memory_usage(logger: logging.Logger, prefix: str = "") -> None:
+    def log_gpu_memory_usage(logger: logging.Logger, 
+                             prefix: str = "", 
+                             stats: Optional[Dict[str, Any]] = None) -> None:
         """
         Log current GPU memory usage
         
         Args:
             logger: Logger instance
             prefix: Optional prefix for log message
+            stats: Previously captured get_gpu_memory_usage() result to log
+                instead of querying CUDA again
         """
-        gpu_status = GPUMemoryUtils.get_gpu_memory_usage()
+        gpu_status = stats if stats is not None else GPUMemoryUtils.get_gpu_memory_usage()
         if gpu_status:
             prefix_str = f"{prefix} " if prefix else ""
             logger.info(f"{prefix_str}GPU Memory - Allocated: {gpu_status['allocated']:.2f}GB, "
@@ -109,7 +169,7 @@ class GPUMemoryUtils:
         log = logger or logging.getLogger(__name__)
         
         try:
-            if device == 'cuda' and not torch.cuda.is_available():
+            if device == 'cuda' and not _cuda_state()[0]:
                 log.warning("CUDA requested but not available, using CPU")
                 device = 'cpu'
                 
@@ -136,21 +196,198 @@ class GPUMemoryUtils:
         log = logger or logging.getLogger(__name__)
         
         try:
-            gpu_before = GPUMemoryUtils.get_gpu_memory_usage()
-            if gpu_before and logger:
+            # Memory is only queried when it is logged
+            gpu_before = GPUMemoryUtils.get_gpu_memory_usage() if logger else None
+            if gpu_before:
                 log.info(f"GPU Memory before offload - Allocated: {gpu_before['allocated']:.2f}GB")
             
             # Move model to CPU
-            if torch.cuda.is_available() and hasattr(model, 'cpu'):
+            if _cuda_state()[0] and hasattr(model, 'cpu'):
                 model.cpu()
                 
-            # Clear GPU cache
+            # Clear GPU cache; a full collection cannot free the model while the caller holds it
             GPUMemoryUtils.clear_gpu_memory(logger)
             
-            gpu_after = GPUMemoryUtils.get_gpu_memory_usage()
-            if gpu_after and logger:
+            gpu_after = GPUMemoryUtils.get_gpu_memory_usage() if logger else None
+            if gpu_after:
                 log.info(f"GPU Memory after offload - Allocated: {gpu_after['allocated']:.2f}GB")
                 
         except Exception as e:
             log.error(f"Error offloading model: {str(e)}")
             raise
+    
+    @staticmethod
+    def offload_model_async(model, stream=None, logger: Optional[logging.Logger] = None):
+        """
+        Offload model parameters and buffers from GPU into pinned host memory
+        without blocking the host
+        
+        Copies are issued with non_blocking=True on a side CUDA stream so they
+        overlap with work on the compute stream. The device blocks are tagged
+        with record_stream, so the caching allocator only reuses them once the
+        copies have finished. The host tensors must not be read before the
+        returned event has completed.
+        
+        Args:
+            model: PyTorch module to offload
+            stream: Optional CUDA stream for the copies (a new one is created if None)
+            logger: Optional logger instance
+            
+        Returns:
+            torch.cuda.Event recorded after the copies, or None if CUDA is not available
+        """
+        if not TORCH_AVAILABLE or not _cuda_state()[0]:
+            return None
+            
+        log = logger or logging.getLogger(__name__)
+        
+        try:
+            stream = stream or torch.cuda.Stream()
+            # Parameters may still be written by queued kernels on the compute stream
+            stream.wait_stream(torch.cuda.current_stream())
+            
+            def stage(tensor):
+                pinned = torch.empty(tensor.size(), dtype=tensor.dtype, pin_memory=True)
+                pinned.copy_(tensor, non_blocking=True)
+                tensor.record_stream(stream)
+                return pinned
+            
+            with torch.no_grad(), torch.cuda.stream(stream):
+                for tensor in itertools.chain(model.parameters(), model.buffers()):
+                    if tensor.is_cuda:
+                        tensor.data = stage(tensor.data)
+                    if tensor.grad is not None and tensor.grad.is_cuda:
+                        tensor.grad = stage(tensor.grad)
+                
+                event = torch.cuda.Event()
+                event.record(stream)
+            
+            if logger:
+                log.info("Model offload to pinned host memory queued")
+            return event
+            
+        except Exception as e:
+            log.error(f"Error offloading model asynchronously: {str(e)}")
+            raise
+    
+    @staticmethod
+    def reload_model_async(model, stream=None, device: str = 'cuda', logger: Optional[logging.Logger] = None):
+        """
+        Copy a model offloaded with offload_model_async back to the GPU without
+        blocking the host
+        
+        Only tensors staged in pinned host memory are moved. Copies are issued
+        with non_blocking=True on the given stream; passing the stream used for
+        the offload orders them after the offload copies without a host
+        synchronization. The current stream waits for the copies, so kernels
+        queued on it afterwards see the restored tensors.
+        
+        Args:
+            model: PyTorch module previously offloaded with offload_model_async
+            stream: CUDA stream for the copies (normally the offload stream;
+                a new one is created if None)
+            device: Target CUDA device
+            logger: Optional logger instance
+            
+        Returns:
+            torch.cuda.Event recorded after the copies, or None if CUDA is not available
+        """
+        if not TORCH_AVAILABLE or not _cuda_state()[0]:
+            return None
+            
+        log = logger or logging.getLogger(__name__)
+        
+        try:
+            stream = stream or torch.cuda.Stream()
+            current_stream = torch.cuda.current_stream()
+            restored = []
+            
+            def restore(tensor):
+                device_tensor = tensor.to(device, non_blocking=True)
+                restored.append(device_tensor)
+                return device_tensor
+            
+            with torch.no_grad(), torch.cuda.stream(stream):
+                for tensor in itertools.chain(model.parameters(), model.buffers()):
+                    if not tensor.is_cuda and tensor.is_pinned():
+                        tensor.data = restore(tensor.data)
+                    if tensor.grad is not None and not tensor.grad.is_cuda and tensor.grad.is_pinned():
+                        tensor.grad = restore(tensor.grad)
+                
+                event = torch.cuda.Event()
+                event.record(stream)
+            
+            # The tensors were allocated on the copy stream but are used on the current one
+            current_stream.wait_stream(stream)
+            for device_tensor in restored:
+                device_tensor.record_stream(current_stream)
+            
+            if logger:
+                log.info("Model reload from pinned host memory queued")
+            return event
+            
+        except Exception as e:
+            log.error(f"Error reloading model asynchronously: {str(e)}")
+            raise
+    
+    @staticmethod
+    def create_memory_pool():
+        """
+        Create a dedicated CUDA caching-allocator memory pool
+        
+        Blocks freed by tensors allocated from the pool stay reserved in it,
+        so re-allocating the same tensors (e.g. reloading a model) reuses them
+        instead of going through cudaFree/cudaMalloc.
+        
+        Returns:
+            torch.cuda.MemPool instance, or None if unsupported by this PyTorch build
+        """
+        if not TORCH_AVAILABLE:
+            return None
+            
+        if _cuda_state()[0] and hasattr(torch.cuda, 'MemPool') and hasattr(torch.cuda, 'use_mem_pool'):
+            return torch.cuda.MemPool()
+        return None
+    
+    @staticmethod
+    def use_memory_pool(pool):
+        """
+        Context manager routing CUDA allocations to the given memory pool
+        
+        Args:
+            pool: Pool returned by create_memory_pool (no-op if None)
+        """
+        if pool is None:
+            return contextlib.nullcontext()
+        return torch.cuda.use_mem_pool(pool)
+    
+    @staticmethod
+    def caching_allocator_alloc(size: int, device: Optional[int] = None, stream=None) -> int:
+        """
+        Allocate raw device memory directly from the CUDA caching allocator
+        
+        Args:
+            size: Number of bytes to allocate
+            device: Optional device index (default: current device)
+            stream: Optional stream the memory will be used on
+            
+        Returns:
+            Device pointer as integer; release it with caching_allocator_delete
+        """
+        if not TORCH_AVAILABLE:
+            raise ImportError("PyTorch not available")
+            
+        return torch.cuda.caching_allocator_alloc(size, device=device, stream=stream)
+    
+    @staticmethod
+    def caching_allocator_delete(ptr: int) -> None:
+        """
+        Return memory obtained from caching_allocator_alloc to the allocator
+        
+        Args:
+            ptr: Device pointer returned by caching_allocator_alloc
+        """
+        if not TORCH_AVAILABLE:
+            raise ImportError("PyTorch not available")
+            
+        torch.cuda.caching_allocator_delete(ptr)
@@ -3,7 +3,9 @@
 import base64
 import io
 import logging
-from typing import Union, Optional
+import mmap
+import os
+from typing import Literal, Union, Optional
 from pathlib import Path
 
 try:
@@ -24,6 +26,74 @@ try:
 except ImportError:
     CV2_AVAILABLE = False
 
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+# SIMD-accelerated base64 codec when installed; both accept any bytes-like object
+if PYBASE64_AVAILABLE:
+    _b64encode = pybase64.b64encode
+    _b64decode = pybase64.b64decode
+else:
+    _b64encode = base64.b64encode
+    _b64decode = base64.b64decode
+
+# Formats whose PIL encoders write strictly sequentially (no seek/tell), so
+# they can be streamed into a base64 encoder
+_STREAMABLE_FORMATS = frozenset({"PNG", "JPEG", "BMP", "WEBP"})
+
+# File signatures of common image formats (PNG, JPEG, GIF, TIFF); WEBP and BMP
+# are checked separately since a file size field follows their magic bytes
+_IMAGE_SIGNATURES = (
+    b"\x89PNG\r\n\x1a\n",
+    b"\xff\xd8\xff",
+    b"GIF87a",
+    b"GIF89a",
+    b"II*\x00",
+    b"MM\x00*",
+)
+
+# Resampling filter used by resize_image for each quality level
+_RESAMPLE_BY_QUALITY = {"fast": "BOX", "balanced": "BILINEAR", "best": "LANCZOS"}
+
+# Bytes encoded per base64 chunk while streaming; a multiple of 3 so no
+# padding is emitted before the end
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
+
+class _Base64Writer(io.RawIOBase):
+    """Write-only stream that base64-encodes written bytes in chunks"""
+    
+    def __init__(self):
+        super().__init__()
+        self._pending = bytearray()  # Bytes not encoded yet
+        self._chunks = []  # Encoded chunks as ASCII strings
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        view = memoryview(data).cast("B")
+        self._pending += view
+        if len(self._pending) >= _B64_CHUNK_SIZE:
+            usable = len(self._pending) - len(self._pending) % 3
+            self._chunks.append(_b64encode(self._pending[:usable]).decode('ascii'))
+            del self._pending[:usable]
+        return view.nbytes
+    
+    def close(self) -> None:
+        # Encode the tail, including padding
+        if not self.closed and self._pending:
+            self._chunks.append(_b64encode(self._pending).decode('ascii'))
+            self._pending = bytearray()
+        super().close()
+    
+    def getvalue(self) -> str:
+        """Return the complete base64 string; only valid after close()"""
+        return "".join(self._chunks)
+
 
 class ImageUtils:
     """Utilities for image processing and conversion"""
@@ -41,7 +111,11 @@ class ImageUtils:
         """
         try:
             with open(image_path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode('utf-8')
+                if os.fstat(image_file.fileno()).st_size == 0:
+                    return ""  # Empty files cannot be memory-mapped
+                # Encode straight from the page cache instead of copying into a bytes object
+                with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return _b64encode(mapped).decode('ascii')
         except Exception as e:
             raise ValueError(f"Error converting image to base64: {str(e)}")
     
@@ -60,7 +134,7 @@ class ImageUtils:
             raise ImportError("PIL/Pillow not available")
             
         try:
-            image_data = base64.b64decode(base64_string)
+            image_data = _b64decode(base64_string)
             return Image.open(io.BytesIO(image_data))
         except Exception as e:
             raise ValueError(f"Error converting base64 to image: {str(e)}")
@@ -81,22 +155,34 @@ class ImageUtils:
             raise ImportError("PIL/Pillow not available")
             
         try:
+            if format.upper() in _STREAMABLE_FORMATS:
+                # Encode while PIL writes, without buffering the whole encoded image
+                writer = _Base64Writer()
+                pil_image.save(writer, format=format)
+                writer.close()
+                return writer.getvalue()
+                
+            # Other encoders may seek, so they still write to an in-memory buffer
             buffer = io.BytesIO()
             pil_image.save(buffer, format=format)
-            return base64.b64encode(buffer.getvalue()).decode('utf-8')
+            # Encode the buffer in place instead of copying it out with getvalue()
+            with buffer.getbuffer() as view:
+                return _b64encode(view).decode('ascii')
         except Exception as e:
             raise ValueError(f"Error converting PIL image to base64: {str(e)}")
     
     @staticmethod
-    def pil_to_numpy(pil_image: 'Image.Image') -> 'np.ndarray':
+    def pil_to_numpy(pil_image: 'Image.Image', ensure_mode: Optional[str] = None) -> 'np.ndarray':
         """
         Convert PIL Image to numpy array
         
         Args:
             pil_image: PIL Image object
+            ensure_mode: Optional PIL mode (e.g. 'RGB') to convert to first; images
+                already in that mode are not converted
             
         Returns:
-            Numpy array representation
+            Numpy array representation (read-only; call .copy() before modifying it)
         """
         if not PIL_AVAILABLE:
             raise ImportError("PIL/Pillow not available")
@@ -104,7 +190,10 @@ class ImageUtils:
             raise ImportError("NumPy not available")
             
         try:
-            return np.array(pil_image)
+            if ensure_mode is not None and pil_image.mode != ensure_mode:
+                pil_image = pil_image.convert(ensure_mode)
+            # Wraps the bytes exported by PIL instead of copying them a second time
+            return np.asarray(pil_image)
         except Exception as e:
             raise ValueError(f"Error converting PIL image to numpy: {str(e)}")
     
@@ -142,16 +231,14 @@ class ImageUtils:
         """
         if not PIL_AVAILABLE:
             raise ImportError("PIL/Pillow not available")
-        if not CV2_AVAILABLE:
-            raise ImportError("OpenCV not available")
         if not NUMPY_AVAILABLE:
             raise ImportError("NumPy not available")
             
         try:
-            # Convert PIL to RGB numpy array
-            rgb_array = np.array(pil_image.convert('RGB'))
-            # Convert RGB to BGR for OpenCV
-            return cv2.cvtColor(rgb_array, cv2.COLOR_RGB2BGR)
+            # View RGB images directly; convert() would copy them once more
+            rgb_array = np.asarray(pil_image if pil_image.mode == 'RGB' else pil_image.convert('RGB'))
+            # Reverse the channels (RGB to BGR) with a single contiguous copy
+            return np.ascontiguousarray(rgb_array[..., ::-1])
         except Exception as e:
             raise ValueError(f"Error converting PIL image to OpenCV format: {str(e)}")
     
@@ -168,17 +255,72 @@ class ImageUtils:
         """
         if not PIL_AVAILABLE:
             raise ImportError("PIL/Pillow not available")
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy not available")
+            
+        try:
+            if cv2_image.ndim == 2:
+                return Image.fromarray(cv2_image)  # Grayscale has no channel order
+            # Convert BGR(A) to RGB by reversing the first three channels
+            return Image.fromarray(np.ascontiguousarray(cv2_image[..., 2::-1]))
+        except Exception as e:
+            raise ValueError(f"Error converting OpenCV image to PIL format: {str(e)}")
+    
+    @staticmethod
+    def ndarray_to_base64(image: 'np.ndarray', ext: str = '.jpg', quality: int = 90) -> str:
+        """
+        Encode an OpenCV image (BGR) to a base64 string without going through PIL
+        
+        Args:
+            image: OpenCV image array (BGR format)
+            ext: Image format extension ('.jpg', '.png', '.webp', etc.)
+            quality: Compression quality 0-100 for JPEG and WEBP
+            
+        Returns:
+            Base64 encoded string
+        """
+        if not CV2_AVAILABLE:
+            raise ImportError("OpenCV not available")
+            
+        try:
+            ext = ext.lower()
+            if ext in ('.jpg', '.jpeg'):
+                params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+            elif ext == '.webp':
+                params = [cv2.IMWRITE_WEBP_QUALITY, quality]
+            else:
+                params = []
+            ok, buffer = cv2.imencode(ext, image, params)
+            if not ok:
+                raise ValueError(f"OpenCV could not encode image as {ext}")
+            return _b64encode(buffer).decode('ascii')
+        except Exception as e:
+            raise ValueError(f"Error converting numpy array to base64: {str(e)}")
+    
+    @staticmethod
+    def base64_to_ndarray(base64_string: str) -> 'np.ndarray':
+        """
+        Decode a base64 image string to an OpenCV image (BGR) without going through PIL
+        
+        Args:
+            base64_string: Base64 encoded image string
+            
+        Returns:
+            OpenCV image array (BGR format)
+        """
         if not CV2_AVAILABLE:
             raise ImportError("OpenCV not available")
         if not NUMPY_AVAILABLE:
             raise ImportError("NumPy not available")
             
         try:
-            # Convert BGR to RGB
-            rgb_array = cv2.cvtColor(cv2_image, cv2.COLOR_BGR2RGB)
-            return Image.fromarray(rgb_array)
+            image_data = np.frombuffer(_b64decode(base64_string), dtype=np.uint8)
+            image = cv2.imdecode(image_data, cv2.IMREAD_COLOR)
+            if image is None:
+                raise ValueError("OpenCV could not decode image data")
+            return image
         except Exception as e:
-            raise ValueError(f"Error converting OpenCV image to PIL format: {str(e)}")
+            raise ValueError(f"Error converting base64 to numpy array: {str(e)}")
     
     @staticmethod
     def save_image(image: Union['Image.Image', 'np.ndarray'], 
@@ -221,14 +363,21 @@ class ImageUtils:
     @staticmethod
     def resize_image(image: 'Image.Image', 
                      size: tuple, 
-                     resample: int = None) -> 'Image.Image':
+                     resample: int = None,
+                     quality: Literal['fast', 'balanced', 'best'] = 'balanced') -> 'Image.Image':
         """
         Resize PIL Image
         
+        With a BOX or BILINEAR filter, downscaling by an integer factor of 2 or
+        more first applies Image.reduce(), a fast box filter, and resamples only
+        the remainder. Other filters (e.g. NEAREST for masks) and 16-bit integer
+        images resize directly.
+        
         Args:
             image: PIL Image object
             size: Target size as (width, height)
-            resample: Resampling algorithm
+            resample: Resampling algorithm (overrides quality if given)
+            quality: 'fast' (BOX), 'balanced' (BILINEAR) or 'best' (LANCZOS)
             
         Returns:
             Resized PIL Image
@@ -237,9 +386,16 @@ class ImageUtils:
             raise ImportError("PIL/Pillow not available")
             
         try:
+            resampling = Image.Resampling if hasattr(Image, 'Resampling') else Image
             if resample is None:
-                resample = Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.LANCZOS
-            return image.resize(size, resample=resample)
+                resample = getattr(resampling, _RESAMPLE_BY_QUALITY[quality])
+            
+            # Integer box reduction first (reducing_gap=1.0), only where averaging
+            # matches the filter; Image.reduce() rejects 16-bit integer modes
+            reducing_gap = None
+            if resample in (resampling.BOX, resampling.BILINEAR) and not image.mode.startswith('I;16'):
+                reducing_gap = 1.0
+            return image.resize(size, resample=resample, reducing_gap=reducing_gap)
         except Exception as e:
             raise ValueError(f"Error resizing image: {str(e)}")
     
@@ -248,12 +404,26 @@ class ImageUtils:
         """
         Validate if file is a valid image format
         
+        Common formats are recognized from their first 12 bytes; other files
+        are opened and verified with PIL.
+        
         Args:
             image_path: Path to the image file
             
         Returns:
             True if valid image, False otherwise
         """
+        try:
+            with open(image_path, "rb") as image_file:
+                head = image_file.read(12)
+        except OSError:
+            return False
+        if (head.startswith(_IMAGE_SIGNATURES)
+                or (head[:4] == b"RIFF" and head[8:12] == b"WEBP")
+                # "BM" alone matches plain text; BMP's reserved bytes 6-9 are zero
+                or (head[:2] == b"BM" and head[6:10] == b"\x00\x00\x00\x00")):
+            return True
+            
         if not PIL_AVAILABLE:
             return False
             
@@ -18,16 +18,20 @@ setup(
     ],
     extras_require={
         "gpu": ["torch>=1.9.0", "torchvision>=0.10.0"],
-        "image": ["pillow>=8.0.0", "numpy>=1.21.0"],
+        "image": ["pillow>=8.0.0", "numpy>=1.21.0", "pybase64>=1.0.0"],
         "opencv": ["opencv-python>=4.5.0"],
-        "queue": ["pika>=1.2.0"],
+        "queue": ["pika>=1.2.0", "orjson>=3.6.0"],
+        "async-queue": ["aio-pika>=8.0.0", "pika>=1.2.0", "orjson>=3.6.0"],
         "all": [
             "torch>=1.9.0", 
             "torchvision>=0.10.0",
             "pillow>=8.0.0", 
             "numpy>=1.21.0",
+            "pybase64>=1.0.0",
             "opencv-python>=4.5.0",
-            "pika>=1.2.0"
+            "pika>=1.2.0",
+            "orjson>=3.6.0",
+            "aio-pika>=8.0.0"
         ]
     },
     python_requires=">=3.8",
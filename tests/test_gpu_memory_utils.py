@@ -0,0 +1,29 @@
+"""Tests for GPUMemoryUtils CUDA probing"""
+
+import types
+
+import pytest
+
+gpu_memory_utils = pytest.importorskip("ai_common.utils.gpu_memory_utils")
+GPUMemoryUtils = gpu_memory_utils.GPUMemoryUtils
+
+
+def test_failed_device_probe_degrades_to_no_cuda(monkeypatch):
+    calls = []
+
+    def get_device_name(index):
+        calls.append(index)
+        raise RuntimeError("Cannot re-initialize CUDA in forked subprocess")
+
+    fake_cuda = types.SimpleNamespace(is_available=lambda: True, get_device_name=get_device_name)
+    monkeypatch.setattr(gpu_memory_utils, "TORCH_AVAILABLE", True)
+    monkeypatch.setattr(gpu_memory_utils, "torch", types.SimpleNamespace(cuda=fake_cuda), raising=False)
+    GPUMemoryUtils.invalidate_cache()
+    try:
+        assert GPUMemoryUtils.get_gpu_memory_usage() is None
+        GPUMemoryUtils.clear_gpu_memory()
+        # The failure is cached instead of being probed again on every call
+        assert GPUMemoryUtils.get_gpu_memory_usage() is None
+        assert calls == [0]
+    finally:
+        GPUMemoryUtils.invalidate_cache()
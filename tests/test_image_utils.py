@@ -0,0 +1,49 @@
+"""Tests for ImageUtils"""
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+ImageUtils = pytest.importorskip("ai_common.utils.image_utils").ImageUtils
+
+
+@pytest.mark.parametrize("mode", ["I;16", "I;16B", "I;16L"])
+def test_resize_downscales_16_bit_images(mode):
+    image = Image.new(mode, (400, 300), 1000)
+
+    resized = ImageUtils.resize_image(image, (100, 75))
+
+    assert resized.size == (100, 75)
+    assert resized.mode == mode
+
+
+def test_resize_with_nearest_keeps_mask_labels():
+    mask = Image.new("L", (400, 400))
+    mask.putdata([255 * ((x + y) % 2) for y in range(400) for x in range(400)])
+
+    resized = ImageUtils.resize_image(mask, (100, 100), resample=Image.NEAREST)
+
+    histogram = resized.histogram()
+    assert sum(histogram[1:255]) == 0
+
+
+def test_resize_pre_reduces_integer_downscales():
+    image = Image.new("RGB", (800, 600), (10, 20, 30))
+
+    resized = ImageUtils.resize_image(image, (200, 150), quality='fast')
+
+    assert resized.size == (200, 150)
+    assert resized.getpixel((0, 0)) == (10, 20, 30)
+
+
+def test_validate_image_format_accepts_bmp(tmp_path):
+    path = tmp_path / "image.bmp"
+    Image.new("RGB", (4, 4)).save(path)
+
+    assert ImageUtils.validate_image_format(path)
+
+
+def test_validate_image_format_rejects_text_starting_with_bm(tmp_path):
+    path = tmp_path / "log.bmp"
+    path.write_text("BMW service log: oil change\n")
+
+    assert not ImageUtils.validate_image_format(path)
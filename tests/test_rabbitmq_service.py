@@ -0,0 +1,129 @@
+"""Tests for RabbitMQService consumer settlement and publisher pooling"""
+
+import pytest
+
+pytest.importorskip("pika")
+
+from pika.exceptions import AMQPConnectionError
+
+from ai_common.queue.rabbitmq_service import RabbitMQService
+
+
+class FakeIOLoop:
+    """Records thread-safe callbacks instead of running them"""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def add_callback_threadsafe(self, callback):
+        self.callbacks.append(callback)
+
+    def run_pending(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+class FakeConnection:
+    def __init__(self):
+        self.ioloop = FakeIOLoop()
+        self.is_open = True
+
+
+class FakeChannel:
+    is_open = True
+
+
+def _process(service, connection):
+    service._process_message_threaded(connection, FakeChannel(), "q", 1, b"{}", lambda data: None)
+
+
+def test_drain_is_scheduled_on_new_connection_after_reconnect():
+    service = RabbitMQService()
+    old_connection, new_connection = FakeConnection(), FakeConnection()
+
+    # A drain is scheduled on the first connection, whose loop then dies
+    service._set_consumer_connection(old_connection)
+    _process(service, old_connection)
+    assert len(old_connection.ioloop.callbacks) == 1
+
+    # A handler started on the old connection finishes after the reconnect
+    service._set_consumer_connection(new_connection)
+    _process(service, old_connection)
+    assert len(old_connection.ioloop.callbacks) == 1
+    assert not service._settled
+
+    # Completions on the new connection still reach its I/O loop
+    _process(service, new_connection)
+    assert len(new_connection.ioloop.callbacks) == 1
+
+
+def test_drains_are_coalesced_per_connection():
+    service = RabbitMQService()
+    connection = FakeConnection()
+    service._set_consumer_connection(connection)
+
+    _process(service, connection)
+    _process(service, connection)
+    assert len(connection.ioloop.callbacks) == 1
+    assert len(service._settled) == 2
+
+    # Once drained, the next completion schedules a new drain
+    connection.ioloop.run_pending()
+    assert not service._settled
+    _process(service, connection)
+    assert len(connection.ioloop.callbacks) == 1
+
+
+class StalePublisherConnection:
+    """Publisher connection the broker has dropped; its channel still reports open"""
+
+    is_closed = False
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class StalePublisherChannel:
+    is_open = True
+
+    def queue_declare(self, queue, durable):
+        raise AMQPConnectionError("Stream connection lost")
+
+    def basic_publish(self, **kwargs):
+        raise AMQPConnectionError("Stream connection lost")
+
+
+class PublisherChannel:
+    is_open = True
+
+    def __init__(self):
+        self.published = []
+
+    def queue_declare(self, queue, durable):
+        pass
+
+    def basic_publish(self, exchange, routing_key, body, properties):
+        self.published.append(routing_key)
+
+
+def test_publish_retries_on_new_connection_when_idle_pairs_are_stale():
+    service = RabbitMQService(publisher_pool_size=2)
+    stale = [StalePublisherConnection(), StalePublisherConnection()]
+    for connection in stale:
+        service._pub_pool.put_nowait((connection, StalePublisherChannel()))
+
+    fresh_channel = PublisherChannel()
+    service._open_publisher = lambda: (StalePublisherConnection(), fresh_channel)
+
+    service.publish("q", {"id": 1})
+
+    assert fresh_channel.published == ["q"]
+    assert all(connection.closed for connection in stale)
+    # Only the fresh pair is pooled, and every slot is free again
+    assert service._pub_pool.qsize() == 1
+    for _ in range(2):
+        assert service._pub_slots.acquire(blocking=False)